@@ -25,7 +25,12 @@ from colour.colorimetry import (
 )
 from colour.constants import CONSTANT_BOLTZMANN, CONSTANT_LIGHT_SPEED
 from colour.hints import ArrayLike, NDArrayFloat
-from colour.utilities import as_float, as_float_array
+from colour.utilities import (
+    CACHE_REGISTRY,
+    as_float,
+    as_float_array,
+    is_caching_enabled,
+)
 from colour.utilities.common import attest
 
 __author__ = "Colour Developers"
@@ -54,6 +59,14 @@ CONSTANT_C2: float = 1.4388e-2
 
 CONSTANT_N: float = 1
 
+_CACHE_SD_BLACKBODY: dict = CACHE_REGISTRY.register_cache(
+    f"{__name__}._CACHE_SD_BLACKBODY"
+)
+
+# The blackbody spectral distributions cache is bounded as most callers pass
+# continuous computed correlated colour temperatures which are rarely reused.
+_CACHE_SD_BLACKBODY_SIZE: int = 256
+
 
 def planck_law(
     wavelength: ArrayLike,
@@ -129,8 +142,12 @@ def planck_law(
     l = np.ravel(l)[..., None]  # noqa: E741
     t = np.ravel(t)[None, ...]
 
-    d = 1 / np.expm1(c2 / (n * l * t))
-    p = ((c1 * n**-2 * l**-5) / np.pi) * d
+    # NOTE: The operations are performed in-place on a single array to avoid
+    # allocating a temporary array per operation.
+    p = n * l * t
+    np.divide(c2, p, out=p)
+    np.expm1(p, out=p)
+    np.divide((c1 * n**-2 * l**-5) / np.pi, p, out=p)
 
     return as_float(np.squeeze(p))
 
@@ -208,12 +225,41 @@ def sd_blackbody(
                          {'method': 'Constant', 'left': None, 'right': None})
     """
 
-    return SpectralDistribution(
+    global _CACHE_SD_BLACKBODY  # noqa: PLW0602
+
+    name = f"{temperature}K Blackbody"
+
+    try:
+        hash_key = hash((temperature, shape, c1, c2, n))
+    except TypeError:
+        hash_key = None
+
+    if is_caching_enabled() and hash_key is not None:
+        # Moving the entry to the end keeps the cache in least recently used
+        # order, the cache might have been cleared in the meantime though.
+        sd = _CACHE_SD_BLACKBODY.pop(hash_key, None)
+        if sd is not None:
+            _CACHE_SD_BLACKBODY[hash_key] = sd
+
+            sd = sd.copy()
+            sd.name = sd.display_name = name
+
+            return sd
+
+    sd = SpectralDistribution(
         planck_law(shape.wavelengths * 1e-9, temperature, c1, c2, n) * 1e-9,
         shape.wavelengths,
-        name=f"{temperature}K Blackbody",
+        name=name,
     )
 
+    if hash_key is not None:
+        _CACHE_SD_BLACKBODY[hash_key] = sd.copy()
+
+        if len(_CACHE_SD_BLACKBODY) > _CACHE_SD_BLACKBODY_SIZE:
+            del _CACHE_SD_BLACKBODY[next(iter(_CACHE_SD_BLACKBODY))]
+
+    return sd
+
 
 def rayleigh_jeans_law(wavelength: ArrayLike, temperature: ArrayLike) -> NDArrayFloat:
     """
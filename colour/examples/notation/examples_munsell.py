@@ -8,66 +8,42 @@ from colour.utilities import message_box
 message_box('"Munsell Renotation System" Computations')
 
 Y = 12.23634268
-message_box(
-    f'Computing "Munsell" value using "Priest, Gibson and MacNicholas (1920)" '
-    f'method for given "luminance" value:\n\n\t{Y}'
-)
-print(colour.munsell_value(Y, method="Priest 1920"))
-print(colour.notation.munsell_value_Priest1920(Y))
-
-print("\n")
-
-message_box(
-    f'Computing "Munsell" value using "Munsell, Sloan and Godlove (1933)" '
-    f'method for given "luminance" value:\n\n\t{Y}'
-)
-print(colour.munsell_value(Y, method="Munsell 1933"))
-print(colour.notation.munsell_value_Munsell1933(Y))
-
-print("\n")
-
-message_box(
-    f'Computing "Munsell" value using "Moon and Spencer (1943)" method for '
-    f'given "luminance" value:\n\n\t{Y}'
-)
-print(colour.munsell_value(Y, method="Moon 1943"))
-print(colour.notation.munsell_value_Moon1943(Y))
-
-print("\n")
-
-message_box(
-    f'Computing "Munsell" value using "Saunderson and Milner (1944)" method '
-    f'for given "luminance" value:\n\n\t{Y}'
-)
-print(colour.munsell_value(Y, method="Saunderson 1944"))
-print(colour.notation.munsell_value_Saunderson1944(Y))
-
-print("\n")
-
-message_box(
-    f'Computing "Munsell" value using "Ladd and Pinney (1955)" method for '
-    f'given "luminance" value:\n\n\t{Y}'
-)
-print(colour.munsell_value(Y, method="Ladd 1955"))
-print(colour.notation.munsell_value_Ladd1955(Y))
-
-print("\n")
-
-message_box(
-    f'Computing "Munsell" value using "McCamy (1987)" method for given '
-    f'"luminance" value:\n\n\t{Y}'
-)
-print(colour.munsell_value(Y, method="McCamy 1987"))
-print(colour.notation.munsell_value_McCamy1987(Y))
+for method, reference, definition in (
+    (
+        "Priest 1920",
+        "Priest, Gibson and MacNicholas (1920)",
+        colour.notation.munsell_value_Priest1920,
+    ),
+    (
+        "Munsell 1933",
+        "Munsell, Sloan and Godlove (1933)",
+        colour.notation.munsell_value_Munsell1933,
+    ),
+    ("Moon 1943", "Moon and Spencer (1943)", colour.notation.munsell_value_Moon1943),
+    (
+        "Saunderson 1944",
+        "Saunderson and Milner (1944)",
+        colour.notation.munsell_value_Saunderson1944,
+    ),
+    ("Ladd 1955", "Ladd and Pinney (1955)", colour.notation.munsell_value_Ladd1955),
+    ("McCamy 1987", "McCamy (1987)", colour.notation.munsell_value_McCamy1987),
+    ("ASTM D1535", "ASTM D1535-08e1", colour.notation.munsell_value_ASTMD1535),
+):
+    message_box(
+        f'Computing "Munsell" value using "{reference}" method for given '
+        f'"luminance" value:\n\n\t{Y}'
+    )
+    print(colour.munsell_value(Y, method=method))
+    print(definition(Y))
 
-print("\n")
+    print("\n")
 
+Y = np.array([12.23634268, 23.42, 50.00000000])
 message_box(
     f'Computing "Munsell" value using "ASTM D1535-08e1" method for given '
-    f'"luminance" value:\n\n\t{Y}'
+    f'"luminance" values:\n\n\t{Y}'
 )
 print(colour.munsell_value(Y, method="ASTM D1535"))
-print(colour.notation.munsell_value_ASTMD1535(Y))
 
 print("\n")
 
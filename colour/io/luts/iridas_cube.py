@@ -16,16 +16,20 @@ References
 
 from __future__ import annotations
 
+from itertools import chain
 from pathlib import Path
 
 import numpy as np
 
+from colour.constants import DTYPE_FLOAT_DEFAULT
+from colour.hints import Generator, Iterable, List
 from colour.io.luts import LUT1D, LUT3D, LUT3x1D, LUTSequence
 from colour.io.luts.common import path_to_title
 from colour.utilities import (
     as_float_array,
     as_int_scalar,
     attest,
+    batch,
     format_array_as_row,
     usage_warning,
 )
@@ -43,6 +47,31 @@ __all__ = [
 ]
 
 
+def _table_lines(lines: Iterable[str], comments: List[str]) -> Generator:
+    """
+    Yield given *Iridas* *.cube* *LUT* table data lines while collecting the
+    comments interleaved with them.
+
+    Parameters
+    ----------
+    lines
+        *LUT* table data lines.
+    comments
+        List the comments are appended to.
+
+    Yields
+    ------
+    Generator
+        *LUT* table data lines.
+    """
+
+    for line in lines:
+        if line.lstrip().startswith("#"):
+            comments.append(line.strip()[1:].strip())
+        else:
+            yield line
+
+
 def read_LUT_IridasCube(path: str | Path) -> LUT3x1D | LUT3D:
     """
     Read given *Iridas* *.cube* *LUT* file.
@@ -126,12 +155,14 @@ def read_LUT_IridasCube(path: str | Path) -> LUT3x1D | LUT3D:
     domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
     dimensions: int = 3
     size: int = 2
-    data = []
     comments = []
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
-        for line in lines:
+        # The keyword lines precede the table data: They are parsed until the
+        # first table data line is reached, the remaining lines are then
+        # streamed to "np.loadtxt" without being held in memory.
+        data = []
+        for line in cube_file:
             line = line.strip()  # noqa: PLW2901
 
             if len(line) == 0:
@@ -155,9 +186,19 @@ def read_LUT_IridasCube(path: str | Path) -> LUT3x1D | LUT3D:
                 dimensions = 3
                 size = as_int_scalar(tokens[1])
             else:
-                data.append(tokens)
+                data.append(line)
+                break
+
+        table = np.loadtxt(
+            _table_lines(chain(data, cube_file), comments),
+            dtype=DTYPE_FLOAT_DEFAULT,
+            ndmin=2,
+        )
 
-    table = as_float_array(data)
+    attest(
+        table.size > 0 and table.shape[1] == 3,
+        '"LUT" table must be a non-empty 3 columns array!',
+    )
 
     LUT: LUT3x1D | LUT3D
     if dimensions == 2:
@@ -288,10 +329,15 @@ def write_LUT_IridasCube(
             )
 
         table = (
-            np.reshape(LUTxD.table, (-1, 3), order="F") if not is_3x1D else LUTxD.table
+            np.reshape(np.transpose(LUTxD.table, (2, 1, 0, 3)), (-1, 3))
+            if not is_3x1D
+            else LUTxD.table
         )
 
-        for array in table:
-            cube_file.write(f"{format_array_as_row(array, decimals)}\n")
+        # The table rows are formatted by batches with a single "%" operation
+        # per batch which is faster than "np.savetxt" formatting each row.
+        row_format = " ".join([f"%.{decimals}f"] * 3) + "\n"
+        for rows in batch(table, 1024):
+            cube_file.write((row_format * len(rows)) % tuple(np.ravel(rows).tolist()))
 
     return True
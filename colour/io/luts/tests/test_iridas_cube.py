@@ -7,6 +7,7 @@ import shutil
 import tempfile
 
 import numpy as np
+import pytest
 
 from colour.constants import TOLERANCE_ABSOLUTE_TESTS
 from colour.io import (
@@ -38,6 +39,16 @@ class TestReadLUTIridasCube:
     unit tests methods.
     """
 
+    def setup_method(self):
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """After tests actions."""
+
+        shutil.rmtree(self._temporary_directory)
+
     def test_read_LUT_IridasCube(self):
         """
         Test :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube`
@@ -104,6 +115,25 @@ class TestReadLUTIridasCube:
         assert LUT_3.dimensions == 3
         assert LUT_3.size == 2
 
+    def test_raise_exception_read_LUT_IridasCube(self):
+        """
+        Test :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, "Empty.cube")
+        with open(path, "w") as cube_file:
+            cube_file.write('TITLE "Empty"\nLUT_1D_SIZE 2\n')
+
+        with pytest.warns(UserWarning):
+            pytest.raises(AssertionError, read_LUT_IridasCube, path)
+
+        path = os.path.join(self._temporary_directory, "Two_Columns.cube")
+        with open(path, "w") as cube_file:
+            cube_file.write('TITLE "Two Columns"\nLUT_1D_SIZE 2\n0 0\n1 1\n')
+
+        pytest.raises(AssertionError, read_LUT_IridasCube, path)
+
 
 class TestWriteLUTIridasCube:
     """